@@ -13,9 +13,8 @@ Logging can be configured via the :func:`set_log_format` and
 import logging
 import os
 import time
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from functools import lru_cache
-from types import MethodType
 
 from pymor.core.defaults import defaults
 from pymor.tools import mpi
@@ -61,6 +60,17 @@ LAST_TIMESTAMP_LENGTH = 0
 
 start_time = time.perf_counter()
 
+_INDENT_STRS = ['']
+
+
+def _indent_str(level):
+    # returns '|   ' * level, the strings for all levels are only built once
+    if level <= 0:
+        return ''
+    while len(_INDENT_STRS) <= level:
+        _INDENT_STRS.append(_INDENT_STRS[-1] + '|   ')
+    return _INDENT_STRS[level]
+
 
 class ColoredFormatter(logging.Formatter):
     """A logging.Formatter that colors loglevel keyword output.
@@ -81,30 +91,38 @@ class ColoredFormatter(logging.Formatter):
                 self.use_color = False
 
         super().__init__()
+        self._paths = {}
+        self._level_formats = {}
+        self._last_elapsed = None
+        self._last_timestamp = None
 
     def _format_common(self, record):
         global LAST_TIMESTAMP_LENGTH
 
         msg = super().format(record)  # call base class to support exception formatting
 
-        # format time
+        # format time, the timestamp only changes once per second
         elapsed = int(time.perf_counter() - start_time)
-        days, remainder = divmod(elapsed, 86400)
-        hours, remainder = divmod(remainder, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        timestamp = f'{days}d {hours:02}:{minutes:02}:{seconds:02}' if days \
-            else f'{hours:02}:{minutes:02}:{seconds:02}' if hours \
-            else f'{minutes:02}:{seconds:02}'
-        if not mpi.rank0:
-            timestamp = f'RANK{mpi.rank}|{timestamp}'
+        if elapsed == self._last_elapsed:
+            timestamp = self._last_timestamp
+        else:
+            days, remainder = divmod(elapsed, 86400)
+            hours, remainder = divmod(remainder, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            timestamp = f'{days}d {hours:02}:{minutes:02}:{seconds:02}' if days \
+                else f'{hours:02}:{minutes:02}:{seconds:02}' if hours \
+                else f'{minutes:02}:{seconds:02}'
+            if not mpi.rank0:
+                timestamp = f'RANK{mpi.rank}|{timestamp}'
+            self._last_elapsed, self._last_timestamp = elapsed, timestamp
         if LAST_TIMESTAMP_LENGTH == 0:
             LAST_TIMESTAMP_LENGTH = len(timestamp)
 
         # handle special cases
         if not record.msg:
-            return ' ' * (LAST_TIMESTAMP_LENGTH+1) + '|   ' * INDENT
+            return ' ' * (LAST_TIMESTAMP_LENGTH+1) + _indent_str(INDENT)
         if record.levelname == 'BLOCK_TIME':
-            return ' ' * (LAST_TIMESTAMP_LENGTH+1) + '|   ' * (INDENT - 1) + r'\----------------- ' + record.msg
+            return ' ' * (LAST_TIMESTAMP_LENGTH+1) + _indent_str(INDENT - 1) + r'\----------------- ' + msg
 
         # handle length change of timestamp
         if len(timestamp) > LAST_TIMESTAMP_LENGTH:
@@ -114,41 +132,55 @@ class ColoredFormatter(logging.Formatter):
                     timestamp = ' ' * (i + 2) + r'\   ' * INDENT + '\n' + timestamp
             LAST_TIMESTAMP_LENGTH = timestep_length
 
-        indent = '|   ' * INDENT
+        indent = _indent_str(INDENT)
 
-        tokens = record.name.split('.')
-        if len(tokens) > MAX_HIERARCHY_LEVEL - 1:
-            path = '.'.join(tokens[1:MAX_HIERARCHY_LEVEL] + [tokens[-1]])
-        else:
-            path = '.'.join(tokens[1:MAX_HIERARCHY_LEVEL])
+        try:
+            path = self._paths[record.name, MAX_HIERARCHY_LEVEL]
+        except KeyError:
+            tokens = record.name.split('.')
+            if len(tokens) > MAX_HIERARCHY_LEVEL - 1:
+                path = '.'.join(tokens[1:MAX_HIERARCHY_LEVEL] + [tokens[-1]])
+            else:
+                path = '.'.join(tokens[1:MAX_HIERARCHY_LEVEL])
+            self._paths[record.name, MAX_HIERARCHY_LEVEL] = path
 
         levelname = record.levelname
         return levelname, path, msg, timestamp, indent
 
-    def format(self, record):
+    def _level_format(self, levelname):
+        # returns the (possibly colored) levelname and the sequences enclosing the logger path
         try:
-            ret = self._format_common(record)
-            levelname, path, msg, timestamp, indent = ret
-        except ValueError:
-            return ret
+            return self._level_formats[levelname]
+        except KeyError:
+            pass
 
         if self.use_color:
             if levelname in ('INFO', 'BLOCK'):
-                path = BOLD_SEQ + path + RESET_SEQ
-                levelname = ''
+                level_format = ('', BOLD_SEQ, RESET_SEQ)
             elif levelname.startswith('INFO'):
-                path = (COLOR_SEQ % (30 + COLORS[levelname])) + path + RESET_SEQ
-                levelname = ''
+                level_format = ('', COLOR_SEQ % (30 + COLORS[levelname]), RESET_SEQ)
             else:
-                path = BOLD_SEQ + path + RESET_SEQ
-                levelname = (COLOR_SEQ % (30 + COLORS[levelname])) + '|' + levelname + '|' + RESET_SEQ
+                level_format = ((COLOR_SEQ % (30 + COLORS[levelname])) + '|' + levelname + '|' + RESET_SEQ,
+                                BOLD_SEQ, RESET_SEQ)
         else:
             if levelname in ('INFO', 'BLOCK'):
-                levelname = ''
+                level_format = ('', '', '')
             else:
-                levelname = '|' + levelname + '|'
+                level_format = ('|' + levelname + '|', '', '')
 
-        return f'{timestamp} {indent}{levelname}{path}: {msg}'
+        self._level_formats[levelname] = level_format
+        return level_format
+
+    def format(self, record):
+        try:
+            ret = self._format_common(record)
+            levelname, path, msg, timestamp, indent = ret
+        except ValueError:
+            return ret
+
+        levelname, path_start, path_end = self._level_format(levelname)
+
+        return f'{timestamp} {indent}{levelname}{path_start}{path}{path_end}: {msg}'
 
     def format_html(self, record):
         try:
@@ -172,17 +204,24 @@ class ColoredFormatter(logging.Formatter):
         return f'{timestamp} {indent}{levelname}{path}: {msg}'
 
 
+_stream_handler = None
+_file_handlers = {}
+
+
 @defaults('filename')
 def default_handler(filename=None):
-    streamhandler = logging.StreamHandler()
-    streamformatter = ColoredFormatter()
-    streamhandler.setFormatter(streamformatter)
-    handlers = [streamhandler]
+    # all loggers share the same handlers instead of creating new ones for each logger
+    global _stream_handler
+    if _stream_handler is None:
+        _stream_handler = logging.StreamHandler()
+        _stream_handler.setFormatter(ColoredFormatter())
+    handlers = [_stream_handler]
     if filename:
-        filehandler = logging.FileHandler(filename)
-        fileformatter = ColoredFormatter()
-        filehandler.setFormatter(fileformatter)
-        handlers.append(filehandler)
+        if filename not in _file_handlers:
+            filehandler = logging.FileHandler(filename)
+            filehandler.setFormatter(ColoredFormatter())
+            _file_handlers[filename] = filehandler
+        handlers.append(_file_handlers[filename])
     return handlers
 
 
@@ -209,9 +248,6 @@ def getLogger(module, level=None, filename=None):
     """
     module = 'pymor' if module == '__main__' else module
     logger = logging.getLogger(module)
-    logger.block = MethodType(_block, logger)
-    logger.info2 = MethodType(_info2, logger)
-    logger.info3 = MethodType(_info3, logger)
     for level_function in ('info', 'error', 'fatal', 'debug', 'block', 'info2', 'info3', 'warning'):
         # add a method that is wrapped in a cache, so calls with same args aren't executed again
         setattr(logger, f'{level_function}_once', lru_cache(None)(getattr(logger, level_function)))
@@ -249,7 +285,7 @@ class DummyLogger:
         return self
 
     def block(self, msg, *args, **kwargs):
-        return LogIndenter(self, False)
+        return _dummy_block
 
     def info2(self, msg, *args, **kwargs):
         self.log(INFO2, msg, *args, **kwargs)
@@ -259,6 +295,7 @@ class DummyLogger:
 
 
 dummy_logger = DummyLogger()
+_dummy_block = nullcontext()
 
 
 @defaults('levels')
@@ -311,9 +348,9 @@ class LogIndenter:
     def __enter__(self):
         global INDENT
         global BLOCK_TIMINGS
-        if BLOCK_TIMINGS:
-            self.tic = time.perf_counter()
         if self.doit:
+            if BLOCK_TIMINGS:
+                self.tic = time.perf_counter()
             INDENT += 1
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -322,7 +359,7 @@ class LogIndenter:
         if self.doit:
             if BLOCK_TIMINGS:
                 duration = time.perf_counter() - self.tic
-                self.logger.log(BLOCK_TIME, f'duration: {duration}s')
+                self.logger.log(BLOCK_TIME, 'duration: %ss', duration)
             INDENT -= 1
 
 
@@ -340,6 +377,13 @@ def _info3(self, msg, *args, **kwargs):
     self.log(INFO3, msg, *args, **kwargs)
 
 
+# the additional logging methods do not depend on the logger instance, so they are
+# added to the Logger class once instead of binding them to each logger in getLogger
+logging.Logger.block = _block
+logging.Logger.info2 = _info2
+logging.Logger.info3 = _info3
+
+
 @contextmanager
 def log_levels(level_mapping):
     """Change levels for given loggers on entry and reset to before state on exit.
@@ -4,7 +4,8 @@
 
 """This module provides some operators for continuous finite element discretizations."""
 
-from functools import partial
+import weakref
+from functools import lru_cache, partial, wraps
 
 import numpy as np
 from scipy.sparse import coo_matrix, csc_matrix
@@ -52,6 +53,135 @@ def CGVectorSpace(grid, id='STATE'):
     return NumpyVectorSpace(grid.size(grid.dim), id)
 
 
+@lru_cache(maxsize=None)
+def _tabulate_shape_functions(reference_element, order):
+    """Tabulate the linear Lagrange shape functions on a |ReferenceElement|.
+
+    Returns the values `SF` of the shape functions at the points of the quadrature
+    of the given `order`, where `SF[p, q]` is the value of the `p`-th shape function
+    at the `q`-th point, and the weights `w` of the quadrature. As the result only
+    depends on the reference element, it is computed only once. The returned
+    arrays are read-only copies.
+    """
+    q, w = reference_element.quadrature(order=order)
+    SF = np.array(tuple(f(q) for f in LagrangeShapeFunctions[reference_element][1]))
+    # the quadrature weights may be owned by the reference element, so only freeze a copy
+    w = w.copy()
+    SF.flags.writeable = w.flags.writeable = False
+    return SF, w
+
+
+@lru_cache(maxsize=None)
+def _tabulate_shape_function_gradients(reference_element, order):
+    """Tabulate the gradients of the bilinear Lagrange shape functions on a |ReferenceElement|.
+
+    Returns the gradients `SF_GRAD` of the shape functions at the points of the
+    quadrature of the given `order`, where `SF_GRAD[p, :, q]` is the gradient of the
+    `p`-th shape function at the `q`-th point, and the weights `w` of the quadrature.
+    The returned arrays are read-only copies.
+    """
+    q, w = reference_element.quadrature(order=order)
+    SF_GRAD = LagrangeShapeFunctionsGrads[reference_element][1](q)
+    w = w.copy()
+    SF_GRAD.flags.writeable = w.flags.writeable = False
+    return SF_GRAD, w
+
+
+def _bincount(indices, weights, minlength):
+    """Sum up `weights` with the same index like :func:`numpy.bincount`, allowing complex weights."""
+    if np.iscomplexobj(weights):
+        return (np.bincount(indices, weights=weights.real, minlength=minlength)
+                + 1j * np.bincount(indices, weights=weights.imag, minlength=minlength))
+    return np.bincount(indices, weights=weights, minlength=minlength)
+
+
+def _cached_per_grid(func):
+    """Cache the return value of `func(grid)` for the lifetime of `grid`.
+
+    The |Grid|'s own cache is not used, as it returns copies of the cached values.
+    """
+    cache = weakref.WeakKeyDictionary()
+
+    @wraps(func)
+    def wrapper(grid):
+        try:
+            return cache[grid]
+        except KeyError:
+            value = cache[grid] = func(grid)
+            return value
+
+    return wrapper
+
+
+def _element_dof_pairs(grid):
+    """Global DOF indices for the entries of all element matrices of a |Grid|.
+
+    Returns the row and column indices `SF_I0`, `SF_I1` of the entries of the
+    element matrices with shape `(grid.size(0), n, n)` in raveled order, where `n`
+    is the number of DOFs per element. The indices are only needed to build the
+    cached pattern of :func:`_element_sparsity_pattern` and are not kept afterwards.
+    """
+    subentities = grid.subentities(0, grid.dim).astype(np.intp)
+    n = subentities.shape[1]
+    local_rows, local_columns = np.divmod(np.arange(n * n), n)
+    SF_I0 = subentities[:, local_rows].ravel()
+    SF_I1 = subentities[:, local_columns].ravel()
+    return SF_I0, SF_I1
+
+
+@_cached_per_grid
+def _element_sparsity_pattern(grid):
+    """CSC sparsity pattern of the system matrices assembled from element matrices.
+
+    Returns `(indptr, indices, SF_MAP, DIAG)`, where `indptr` and `indices` define
+    the pattern, `SF_MAP` maps each entry of the raveled element matrices to the
+    position of its global matrix entry in the data array and `DIAG` contains the
+    positions of the diagonal entries. The returned arrays are read-only.
+    """
+    n = grid.size(grid.dim)
+    SF_I0, SF_I1 = _element_dof_pairs(grid)
+    # linear indices in column-major order, so that sorting them yields CSC ordering
+    entries, SF_MAP = np.unique(SF_I1 * n + SF_I0, return_inverse=True)
+    del SF_I0, SF_I1
+    # store the pattern with the smallest index dtype scipy.sparse accepts, so that csc_matrix
+    # does not need to convert the index arrays on every assembly
+    index_dtype = np.int32 if max(len(entries), n) <= np.iinfo(np.int32).max else np.int64
+    indices = (entries % n).astype(index_dtype)
+    indptr = np.zeros(n + 1, dtype=index_dtype)
+    np.cumsum(np.bincount(entries // n, minlength=n), out=indptr[1:])
+    DIAG = np.searchsorted(entries, np.arange(n) * (n + 1))
+    for a in (indptr, indices, SF_MAP, DIAG):
+        a.flags.writeable = False
+    return indptr, indices, SF_MAP, DIAG
+
+
+def _assemble_element_matrices(grid, SF_INTS, clear_rows=None, clear_columns=None, unit_diagonal=None):
+    """Sum up raveled element matrices into a global |CSC matrix|.
+
+    The entries of `SF_INTS` are directly accumulated in the data array of the
+    cached sparsity pattern of `grid`, avoiding the construction of an
+    intermediate COO matrix. Afterwards, the rows and columns of the DOFs
+    selected by the boolean masks `clear_rows` and `clear_columns` are set to
+    zero and the diagonal entries of the DOFs selected by `unit_diagonal` are
+    incremented by one. Zero entries, e.g. resulting from cleared Dirichlet rows,
+    are removed from the matrix.
+    """
+    indptr, indices, SF_MAP, DIAG = _element_sparsity_pattern(grid)
+    data = _bincount(SF_MAP, SF_INTS, len(indices))
+    # the boundary treatment works on the summed up entries, which are much fewer
+    # than the entries of all element matrices
+    if clear_rows is not None:
+        data[clear_rows[indices]] = 0
+    if clear_columns is not None:
+        data[np.repeat(clear_columns, np.diff(indptr))] = 0
+    if unit_diagonal is not None:
+        data[DIAG[unit_diagonal]] += 1
+    n = grid.size(grid.dim)
+    A = csc_matrix((data, indices.copy(), indptr.copy()), shape=(n, n))
+    A.eliminate_zeros()
+    return A
+
+
 class L2ProductFunctionalP1(NumpyMatrixBasedOperator):
     """Linear functional representing the inner product with an L2-|Function|.
 
@@ -89,18 +219,15 @@ class L2ProductFunctionalP1(NumpyMatrixBasedOperator):
 
         # evaluate the shape functions at the quadrature points on the reference
         # element -> shape = (number of shape functions, number of quadrature points)
-        q, w = g.reference_element.quadrature(order=1)
-        SF = LagrangeShapeFunctions[g.reference_element][1]
-        SF = np.array(tuple(f(q) for f in SF))
+        SF, w = _tabulate_shape_functions(g.reference_element, 1)
 
         # integrate the products of the function with the shape functions on each element
         # -> shape = (g.size(0), number of shape functions)
-        SF_INTS = np.einsum('e,pi,e,i->ep', F, SF, g.integration_elements(0), w).ravel()
+        SF_INTS = np.multiply.outer(F * g.integration_elements(0), SF.dot(w)).ravel()
 
         # map local DOFs to global DOFs
-        # FIXME This implementation is horrible, find a better way!
         SF_I = g.subentities(0, g.dim).ravel()
-        I = coo_matrix((SF_INTS, (np.zeros_like(SF_I), SF_I)), shape=(1, g.size(g.dim))).toarray().ravel()
+        I = _bincount(SF_I, SF_INTS, g.size(g.dim))
 
         if self.dirichlet_clear_dofs and bi.has_dirichlet:
             DI = bi.dirichlet_boundaries(g.dim)
@@ -150,13 +277,10 @@ class BoundaryL2ProductFunctional(NumpyMatrixBasedOperator):
             I[NI] = self.function(g.centers(1)[NI], mu=mu)
         else:
             F = self.function(g.centers(1)[NI], mu=mu)
-            q, w = line.quadrature(order=1)
-            # remove last dimension of q, as line coordinates are one dimensional
-            q = q[:, 0]
-            SF = np.array([1 - q, q])
-            SF_INTS = np.einsum('e,pi,e,i->ep', F, SF, g.integration_elements(1)[NI], w).ravel()
+            SF, w = _tabulate_shape_functions(line, 1)
+            SF_INTS = np.multiply.outer(F * g.integration_elements(1)[NI], SF.dot(w)).ravel()
             SF_I = g.subentities(1, 2)[NI].ravel()
-            I = coo_matrix((SF_INTS, (np.zeros_like(SF_I), SF_I)), shape=(1, g.size(g.dim))).toarray().ravel()
+            I = _bincount(SF_I, SF_INTS, g.size(g.dim))
 
         if self.dirichlet_clear_dofs and bi.has_dirichlet:
             DI = bi.dirichlet_boundaries(g.dim)
@@ -237,18 +361,15 @@ class L2ProductFunctionalQ1(NumpyMatrixBasedOperator):
 
         # evaluate the shape functions at the quadrature points on the reference
         # element -> shape = (number of shape functions, number of quadrature points)
-        q, w = g.reference_element.quadrature(order=1)
-        SF = LagrangeShapeFunctions[g.reference_element][1]
-        SF = np.array(tuple(f(q) for f in SF))
+        SF, w = _tabulate_shape_functions(g.reference_element, 1)
 
         # integrate the products of the function with the shape functions on each element
         # -> shape = (g.size(0), number of shape functions)
-        SF_INTS = np.einsum('e,pi,e,i->ep', F, SF, g.integration_elements(0), w).ravel()
+        SF_INTS = np.multiply.outer(F * g.integration_elements(0), SF.dot(w)).ravel()
 
         # map local DOFs to global DOFs
-        # FIXME This implementation is horrible, find a better way!
         SF_I = g.subentities(0, g.dim).ravel()
-        I = coo_matrix((SF_INTS, (np.zeros_like(SF_I), SF_I)), shape=(1, g.size(g.dim))).toarray().ravel()
+        I = _bincount(SF_I, SF_INTS, g.size(g.dim))
 
         if self.dirichlet_clear_dofs and bi.has_dirichlet:
             DI = bi.dirichlet_boundaries(g.dim)
@@ -298,41 +419,31 @@ class L2ProductP1(NumpyMatrixBasedOperator):
         bi = self.boundary_info
 
         # evaluate the shape functions on the quadrature points
-        q, w = g.reference_element.quadrature(order=2)
-        SF = LagrangeShapeFunctions[g.reference_element][1]
-        SF = np.array(tuple(f(q) for f in SF))
+        SF, w = _tabulate_shape_functions(g.reference_element, 2)
 
         self.logger.info('Integrate the products of the shape functions on each element')
-        # -> shape = (g.size(0), number of shape functions ** 2)
+        # the integrals on the reference element only need to be computed once and are then
+        # scaled for each element -> shape = (g.size(0), number of shape functions ** 2)
+        SF_INTS_REF = np.einsum('iq,jq,q->ij', SF, SF, w).ravel()
         if self.coefficient_function is not None:
             C = self.coefficient_function(self.grid.centers(0), mu=mu)
-            SF_INTS = np.einsum('iq,jq,q,e,e->eij', SF, SF, w, g.integration_elements(0), C).ravel()
+            SF_INTS = np.multiply.outer(g.integration_elements(0) * C, SF_INTS_REF).ravel()
             del C
         else:
-            SF_INTS = np.einsum('iq,jq,q,e->eij', SF, SF, w, g.integration_elements(0)).ravel()
+            SF_INTS = np.multiply.outer(g.integration_elements(0), SF_INTS_REF).ravel()
 
-        del SF
-
-        self.logger.info('Determine global dofs ...')
-        SF_I0 = np.repeat(g.subentities(0, g.dim), g.dim + 1, axis=1).ravel()
-        SF_I1 = np.tile(g.subentities(0, g.dim), [1, g.dim + 1]).ravel()
+        del SF, SF_INTS_REF
 
         self.logger.info('Boundary treatment ...')
-        if bi.has_dirichlet:
-            if self.dirichlet_clear_rows:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I0], 0, SF_INTS)
-            if self.dirichlet_clear_columns:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I1], 0, SF_INTS)
-            if not self.dirichlet_clear_diag and (self.dirichlet_clear_rows or self.dirichlet_clear_columns):
-                SF_INTS = np.hstack((SF_INTS, np.ones(bi.dirichlet_boundaries(g.dim).size)))
-                SF_I0 = np.hstack((SF_I0, bi.dirichlet_boundaries(g.dim)))
-                SF_I1 = np.hstack((SF_I1, bi.dirichlet_boundaries(g.dim)))
+        DM = None
+        if bi.has_dirichlet and (self.dirichlet_clear_rows or self.dirichlet_clear_columns):
+            DM = bi.dirichlet_mask(g.dim)
 
         self.logger.info('Assemble system matrix ...')
-        A = coo_matrix((SF_INTS, (SF_I0, SF_I1)), shape=(g.size(g.dim), g.size(g.dim)))
-        del SF_INTS, SF_I0, SF_I1
-        A.eliminate_zeros()
-        A = csc_matrix(A).copy()  # See DiffusionOperatorP1 for why copy() is necessary
+        A = _assemble_element_matrices(g, SF_INTS,
+                                       clear_rows=DM if self.dirichlet_clear_rows else None,
+                                       clear_columns=DM if self.dirichlet_clear_columns else None,
+                                       unit_diagonal=None if self.dirichlet_clear_diag else DM)
 
         return A
 
@@ -378,41 +489,31 @@ class L2ProductQ1(NumpyMatrixBasedOperator):
         bi = self.boundary_info
 
         # evaluate the shape functions on the quadrature points
-        q, w = square.quadrature(order=2)
-        SF = LagrangeShapeFunctions[g.reference_element][1]
-        SF = np.array(tuple(f(q) for f in SF))
+        SF, w = _tabulate_shape_functions(square, 2)
 
         self.logger.info('Integrate the products of the shape functions on each element')
-        # -> shape = (g.size(0), number of shape functions ** 2)
+        # the integrals on the reference element only need to be computed once and are then
+        # scaled for each element -> shape = (g.size(0), number of shape functions ** 2)
+        SF_INTS_REF = np.einsum('iq,jq,q->ij', SF, SF, w).ravel()
         if self.coefficient_function is not None:
             C = self.coefficient_function(self.grid.centers(0), mu=mu)
-            SF_INTS = np.einsum('iq,jq,q,e,e->eij', SF, SF, w, g.integration_elements(0), C).ravel()
+            SF_INTS = np.multiply.outer(g.integration_elements(0) * C, SF_INTS_REF).ravel()
             del C
         else:
-            SF_INTS = np.einsum('iq,jq,q,e->eij', SF, SF, w, g.integration_elements(0)).ravel()
-
-        del SF
+            SF_INTS = np.multiply.outer(g.integration_elements(0), SF_INTS_REF).ravel()
 
-        self.logger.info('Determine global dofs ...')
-        SF_I0 = np.repeat(g.subentities(0, g.dim), 4, axis=1).ravel()
-        SF_I1 = np.tile(g.subentities(0, g.dim), [1, 4]).ravel()
+        del SF, SF_INTS_REF
 
         self.logger.info('Boundary treatment ...')
-        if bi.has_dirichlet:
-            if self.dirichlet_clear_rows:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I0], 0, SF_INTS)
-            if self.dirichlet_clear_columns:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I1], 0, SF_INTS)
-            if not self.dirichlet_clear_diag and (self.dirichlet_clear_rows or self.dirichlet_clear_columns):
-                SF_INTS = np.hstack((SF_INTS, np.ones(bi.dirichlet_boundaries(g.dim).size)))
-                SF_I0 = np.hstack((SF_I0, bi.dirichlet_boundaries(g.dim)))
-                SF_I1 = np.hstack((SF_I1, bi.dirichlet_boundaries(g.dim)))
+        DM = None
+        if bi.has_dirichlet and (self.dirichlet_clear_rows or self.dirichlet_clear_columns):
+            DM = bi.dirichlet_mask(g.dim)
 
         self.logger.info('Assemble system matrix ...')
-        A = coo_matrix((SF_INTS, (SF_I0, SF_I1)), shape=(g.size(g.dim), g.size(g.dim)))
-        del SF_INTS, SF_I0, SF_I1
-        A.eliminate_zeros()
-        A = csc_matrix(A).copy()  # See DiffusionOperatorP1 for why copy() is necessary
+        A = _assemble_element_matrices(g, SF_INTS,
+                                       clear_rows=DM if self.dirichlet_clear_rows else None,
+                                       clear_columns=DM if self.dirichlet_clear_columns else None,
+                                       unit_diagonal=None if self.dirichlet_clear_diag else DM)
 
         return A
 
@@ -476,48 +577,32 @@ class DiffusionOperatorP1(NumpyMatrixBasedOperator):
         SF_GRADS = np.einsum('eij,pj->epi', g.jacobian_inverse_transposed(0), SF_GRAD)
 
         self.logger.info('Calculate all local scalar products between gradients ...')
+        # fold the diffusion constant and scalar diffusion values into the element weights
+        # to avoid additional passes over the element matrices
+        W = g.volumes(0)
+        if self.diffusion_constant is not None:
+            W = W * self.diffusion_constant
         if self.diffusion_function is not None and self.diffusion_function.shape_range == ():
             D = self.diffusion_function(self.grid.centers(0), mu=mu)
-            SF_INTS = np.einsum('epi,eqi,e,e->epq', SF_GRADS, SF_GRADS, g.volumes(0), D).ravel()
+            SF_INTS = np.einsum('epi,eqi,e->epq', SF_GRADS, SF_GRADS, W * D).ravel()
             del D
         elif self.diffusion_function is not None:
             D = self.diffusion_function(self.grid.centers(0), mu=mu)
-            SF_INTS = np.einsum('epi,eqj,e,eij->epq', SF_GRADS, SF_GRADS, g.volumes(0), D).ravel()
+            SF_INTS = np.einsum('epi,eqj,e,eij->epq', SF_GRADS, SF_GRADS, W, D).ravel()
             del D
         else:
-            SF_INTS = np.einsum('epi,eqi,e->epq', SF_GRADS, SF_GRADS, g.volumes(0)).ravel()
-
-        del SF_GRADS
-
-        if self.diffusion_constant is not None:
-            SF_INTS *= self.diffusion_constant
+            SF_INTS = np.einsum('epi,eqi,e->epq', SF_GRADS, SF_GRADS, W).ravel()
 
-        self.logger.info('Determine global dofs ...')
-        SF_I0 = np.repeat(g.subentities(0, g.dim), g.dim + 1, axis=1).ravel()
-        SF_I1 = np.tile(g.subentities(0, g.dim), [1, g.dim + 1]).ravel()
+        del SF_GRADS, W
 
         self.logger.info('Boundary treatment ...')
-        if bi.has_dirichlet:
-            SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I0], 0, SF_INTS)
-            if self.dirichlet_clear_columns:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I1], 0, SF_INTS)
-
-            if not self.dirichlet_clear_diag:
-                SF_INTS = np.hstack((SF_INTS, np.ones(bi.dirichlet_boundaries(g.dim).size)))
-                SF_I0 = np.hstack((SF_I0, bi.dirichlet_boundaries(g.dim)))
-                SF_I1 = np.hstack((SF_I1, bi.dirichlet_boundaries(g.dim)))
+        DM = bi.dirichlet_mask(g.dim) if bi.has_dirichlet else None
 
         self.logger.info('Assemble system matrix ...')
-        A = coo_matrix((SF_INTS, (SF_I0, SF_I1)), shape=(g.size(g.dim), g.size(g.dim)))
-        del SF_INTS, SF_I0, SF_I1
-        A.eliminate_zeros()
-        A = csc_matrix(A).copy()
-
-        # The call to copy() is necessary to resize the data arrays of the sparse matrix:
-        # During the conversion to crs_matrix, entries corresponding with the same
-        # coordinates are summed up, resulting in shorter data arrays. The shortening
-        # is implemented by calling self.prune() which creates the view self.data[:self.nnz].
-        # Thus, the original data array is not deleted and all memory stays allocated.
+        A = _assemble_element_matrices(g, SF_INTS,
+                                       clear_rows=DM,
+                                       clear_columns=DM if self.dirichlet_clear_columns else None,
+                                       unit_diagonal=None if self.dirichlet_clear_diag else DM)
 
         return A
 
@@ -575,9 +660,7 @@ class DiffusionOperatorQ1(NumpyMatrixBasedOperator):
         bi = self.boundary_info
 
         # gradients of shape functions
-        q, w = g.reference_element.quadrature(order=2)
-        SF_GRAD = LagrangeShapeFunctionsGrads[g.reference_element][1]
-        SF_GRAD = SF_GRAD(q)
+        SF_GRAD, w = _tabulate_shape_function_gradients(g.reference_element, 2)
 
         self.logger.info('Calculate gradients of shape functions transformed by reference map ...')
         SF_GRADS = np.einsum('eij,pjc->epic', g.jacobian_inverse_transposed(0), SF_GRAD)
@@ -599,33 +682,14 @@ class DiffusionOperatorQ1(NumpyMatrixBasedOperator):
         if self.diffusion_constant is not None:
             SF_INTS *= self.diffusion_constant
 
-        self.logger.info('Determine global dofs ...')
-
-        SF_I0 = np.repeat(g.subentities(0, g.dim), 4, axis=1).ravel()
-        SF_I1 = np.tile(g.subentities(0, g.dim), [1, 4]).ravel()
-
         self.logger.info('Boundary treatment ...')
-        if bi.has_dirichlet:
-            SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I0], 0, SF_INTS)
-            if self.dirichlet_clear_columns:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I1], 0, SF_INTS)
-
-            if not self.dirichlet_clear_diag:
-                SF_INTS = np.hstack((SF_INTS, np.ones(bi.dirichlet_boundaries(g.dim).size)))
-                SF_I0 = np.hstack((SF_I0, bi.dirichlet_boundaries(g.dim)))
-                SF_I1 = np.hstack((SF_I1, bi.dirichlet_boundaries(g.dim)))
+        DM = bi.dirichlet_mask(g.dim) if bi.has_dirichlet else None
 
         self.logger.info('Assemble system matrix ...')
-        A = coo_matrix((SF_INTS, (SF_I0, SF_I1)), shape=(g.size(g.dim), g.size(g.dim)))
-        del SF_INTS, SF_I0, SF_I1
-        A.eliminate_zeros()
-        A = csc_matrix(A).copy()
-
-        # The call to copy() is necessary to resize the data arrays of the sparse matrix:
-        # During the conversion to crs_matrix, entries corresponding with the same
-        # coordinates are summed up, resulting in shorter data arrays. The shortening
-        # is implemented by calling self.prune() which creates the view self.data[:self.nnz].
-        # Thus, the original data array is not deleted and all memory stays allocated.
+        A = _assemble_element_matrices(g, SF_INTS,
+                                       clear_rows=DM,
+                                       clear_columns=DM if self.dirichlet_clear_columns else None,
+                                       unit_diagonal=None if self.dirichlet_clear_diag else DM)
 
         return A
 
@@ -681,15 +745,12 @@ class AdvectionOperatorP1(NumpyMatrixBasedOperator):
         g = self.grid
         bi = self.boundary_info
 
-        q, w = g.reference_element.quadrature(order=1)
-        SF = LagrangeShapeFunctions[g.reference_element][1]
-
         self.logger.info('Calculate gradients of shape functions transformed by reference map ...')
         SF_GRAD = LagrangeShapeFunctionsGrads[g.reference_element][1]
         SF_GRADS = np.einsum('eij,pj->epi', g.jacobian_inverse_transposed(0), SF_GRAD)
         # SF_GRADS(element, function, component)
 
-        SFQ = np.array(tuple(f(q) for f in SF))
+        SFQ, w = _tabulate_shape_functions(g.reference_element, 1)
         # SFQ(function, quadraturepoint)
 
         self.logger.info('Calculate all local scalar products between gradients ...')
@@ -701,32 +762,14 @@ class AdvectionOperatorP1(NumpyMatrixBasedOperator):
         if self.advection_constant is not None:
             SF_INTS *= self.advection_constant
 
-        self.logger.info('Determine global dofs ...')
-        SF_I0 = np.repeat(g.subentities(0, g.dim), g.dim + 1, axis=1).ravel()
-        SF_I1 = np.tile(g.subentities(0, g.dim), [1, g.dim + 1]).ravel()
-
         self.logger.info('Boundary treatment ...')
-        if bi.has_dirichlet:
-            SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I0], 0, SF_INTS)
-            if self.dirichlet_clear_columns:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I1], 0, SF_INTS)
-
-            if not self.dirichlet_clear_diag:
-                SF_INTS = np.hstack((SF_INTS, np.ones(bi.dirichlet_boundaries(g.dim).size)))
-                SF_I0 = np.hstack((SF_I0, bi.dirichlet_boundaries(g.dim)))
-                SF_I1 = np.hstack((SF_I1, bi.dirichlet_boundaries(g.dim)))
+        DM = bi.dirichlet_mask(g.dim) if bi.has_dirichlet else None
 
         self.logger.info('Assemble system matrix ...')
-        A = coo_matrix((SF_INTS, (SF_I0, SF_I1)), shape=(g.size(g.dim), g.size(g.dim)))
-        del SF_INTS, SF_I0, SF_I1
-        A.eliminate_zeros()
-        A = csc_matrix(A).copy()
-
-        # The call to copy() is necessary to resize the data arrays of the sparse matrix:
-        # During the conversion to crs_matrix, entries corresponding with the same
-        # coordinates are summed up, resulting in shorter data arrays. The shortening
-        # is implemented by calling self.prune() which creates the view self.data[:self.nnz].
-        # Thus, the original data array is not deleted and all memory stays allocated.
+        A = _assemble_element_matrices(g, SF_INTS,
+                                       clear_rows=DM,
+                                       clear_columns=DM if self.dirichlet_clear_columns else None,
+                                       unit_diagonal=None if self.dirichlet_clear_diag else DM)
 
         return A
 
@@ -782,13 +825,11 @@ class AdvectionOperatorQ1(NumpyMatrixBasedOperator):
         bi = self.boundary_info
 
         self.logger.info('Calculate gradients of shape functions transformed by reference map ...')
-        q, w = g.reference_element.quadrature(order=2)
-        SF_GRAD = LagrangeShapeFunctionsGrads[g.reference_element][1](q)
+        SF_GRAD, w = _tabulate_shape_function_gradients(g.reference_element, 2)
         SF_GRADS = np.einsum('eij,pjc->epic', g.jacobian_inverse_transposed(0), SF_GRAD)
         # SF_GRADS(element,function,component,quadraturepoint)
 
-        SF = LagrangeShapeFunctions[g.reference_element][1]
-        SFQ = np.array(tuple(f(q) for f in SF))
+        SFQ, _ = _tabulate_shape_functions(g.reference_element, 2)
         # SFQ(function, quadraturepoint)
 
         self.logger.info('Calculate all local scalar products between gradients ...')
@@ -801,33 +842,14 @@ class AdvectionOperatorQ1(NumpyMatrixBasedOperator):
         if self.advection_constant is not None:
             SF_INTS *= self.advection_constant
 
-        self.logger.info('Determine global dofs ...')
-
-        SF_I0 = np.repeat(g.subentities(0, g.dim), 4, axis=1).ravel()
-        SF_I1 = np.tile(g.subentities(0, g.dim), [1, 4]).ravel()
-
         self.logger.info('Boundary treatment ...')
-        if bi.has_dirichlet:
-            SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I0], 0, SF_INTS)
-            if self.dirichlet_clear_columns:
-                SF_INTS = np.where(bi.dirichlet_mask(g.dim)[SF_I1], 0, SF_INTS)
-
-            if not self.dirichlet_clear_diag:
-                SF_INTS = np.hstack((SF_INTS, np.ones(bi.dirichlet_boundaries(g.dim).size)))
-                SF_I0 = np.hstack((SF_I0, bi.dirichlet_boundaries(g.dim)))
-                SF_I1 = np.hstack((SF_I1, bi.dirichlet_boundaries(g.dim)))
+        DM = bi.dirichlet_mask(g.dim) if bi.has_dirichlet else None
 
         self.logger.info('Assemble system matrix ...')
-        A = coo_matrix((SF_INTS, (SF_I0, SF_I1)), shape=(g.size(g.dim), g.size(g.dim)))
-        del SF_INTS, SF_I0, SF_I1
-        A.eliminate_zeros()
-        A = csc_matrix(A).copy()
-
-        # The call to copy() is necessary to resize the data arrays of the sparse matrix:
-        # During the conversion to crs_matrix, entries corresponding with the same
-        # coordinates are summed up, resulting in shorter data arrays. The shortening
-        # is implemented by calling self.prune() which creates the view self.data[:self.nnz].
-        # Thus, the original data array is not deleted and all memory stays allocated.
+        A = _assemble_element_matrices(g, SF_INTS,
+                                       clear_rows=DM,
+                                       clear_columns=DM if self.dirichlet_clear_columns else None,
+                                       unit_diagonal=None if self.dirichlet_clear_diag else DM)
 
         return A
 
@@ -901,10 +923,7 @@ class RobinBoundaryOperator(NumpyMatrixBasedOperator):
                 robin_c = np.einsum('ei,eqi->eq', normals, robin_values)
 
             # robin_c(robin-index, quadraturepoint-index)
-            q, w = line.quadrature(order=2)
-            # remove last dimension of q, as line coordinates are one dimensional
-            q = q[:, 0]
-            SF = np.array([1 - q, q])
+            SF, w = _tabulate_shape_functions(line, 2)
             SF_INTS = np.einsum('e,pi,pj,e,p->eij', robin_c, SF, SF, g.integration_elements(1)[RI], w).ravel()
             SF_I0 = np.repeat(g.subentities(1, g.dim)[RI], 2).ravel()
             SF_I1 = np.tile(g.subentities(1, g.dim)[RI], [1, 2]).ravel()
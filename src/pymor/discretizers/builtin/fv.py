@@ -419,7 +419,12 @@ class NonlinearAdvectionOperator(Operator):
 
         A = coo_matrix((V, (I0, I1)), shape=(g.size(0), g.size(0)))
         A.eliminate_zeros()
-        A = csc_matrix(A).copy()   # See pymor.discretizers.builtin.cg.DiffusionOperatorP1 for why copy() is necessary
+        # The call to copy() is necessary to resize the data arrays of the sparse matrix:
+        # During the conversion to csc_matrix, entries corresponding with the same
+        # coordinates are summed up, resulting in shorter data arrays. The shortening
+        # is implemented by calling self.prune() which creates the view self.data[:self.nnz].
+        # Thus, the original data array is not deleted and all memory stays allocated.
+        A = csc_matrix(A).copy()
         A = dia_matrix(([1. / VOLS0], [0]), shape=(g.size(0),) * 2) * A
 
         return NumpyMatrixOperator(A, source_id=self.source.id, range_id=self.range.id)
@@ -511,7 +516,7 @@ class LinearAdvectionLaxFriedrichsOperator(NumpyMatrixBasedOperator):
 
         A = coo_matrix((V, (I0, I1)), shape=(g.size(0), g.size(0)))
         A.eliminate_zeros()
-        A = csc_matrix(A).copy()   # See pymor.discretizers.builtin.cg.DiffusionOperatorP1 for why copy() is necessary
+        A = csc_matrix(A).copy()   # See NonlinearAdvectionOperator.jacobian for why copy() is necessary
         A = dia_matrix(([1. / g.volumes(0)], [0]), shape=(g.size(0),) * 2) * A
 
         return A
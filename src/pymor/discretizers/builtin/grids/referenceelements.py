@@ -201,7 +201,7 @@ class Square(ReferenceElement):
             assert order is not None or npoints is not None, 'must specify "order" or "npoints"'
             assert order is None or npoints is None, 'cannot specify "order" and "npoints"'
             if order is not None:
-                assert 0 <= order <= self._quadrature_order_map.size - 1,\
+                assert 0 <= order <= len(self._quadrature_order_map) - 1,\
                     ValueError(f'order {order} not implmented')
                 p = self._quadrature_order_map[order]
             else:
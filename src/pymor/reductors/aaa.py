@@ -82,10 +82,12 @@ class PAAAReductor(BasicObject):
             self._parameters = fom.parameters
             self.samples = np.empty([len(sv) for sv in sampling_values] + [fom.dim_output, fom.dim_input],
                                     dtype=sampling_values[0].dtype)
-            for idx, vals in zip(np.ndindex(self.samples.shape[:-2]),
-                                 itertools.product(*sampling_values)):
-                params = fom.parameters.parse(vals[1:])
-                self.samples[idx] = fom.eval_tf(vals[0], mu=params)
+            # parse each parameter value only once and sample all Laplace variable values for it
+            for idx, vals in zip(np.ndindex(self.samples.shape[1:-2]),
+                                 itertools.product(*sampling_values[1:])):
+                params = fom.parameters.parse(vals)
+                for i, s in enumerate(sampling_values[0]):
+                    self.samples[(i,) + idx] = fom.eval_tf(s, mu=params)
             if fom.dim_input == fom.dim_output == 1:
                 self.samples = self.samples.reshape(self.samples.shape[:-2])
         else:
@@ -98,25 +100,17 @@ class PAAAReductor(BasicObject):
 
         # add complex conjugate samples
         if conjugate:
-            s_conj_list = []
-            samples_conj_list = None
-            for i, s in enumerate(sampling_values[0]):
-                if s.conj() not in sampling_values[0]:
-                    s_conj_list.append(s.conj())
-                    if samples_conj_list is None:
-                        samples_conj_list = self.samples[i, None].conj()
-                    else:
-                        samples_conj_list = np.concatenate((samples_conj_list, self.samples[i, None].conj()))
-            if s_conj_list:
-                sampling_values[0] = np.append(sampling_values[0], s_conj_list)
-                self.samples = np.concatenate((self.samples, samples_conj_list))
+            s_conj = sampling_values[0].conj()
+            missing = ~np.isin(s_conj, sampling_values[0])
+            if np.any(missing):
+                sampling_values[0] = np.concatenate((sampling_values[0], s_conj[missing]))
+                self.samples = np.concatenate((self.samples, self.samples[missing].conj()))
 
         # Transform samples for MIMO case
         if len(self.samples.shape) != len(sampling_values):
             assert len(self.samples.shape) == len(sampling_values) + 2
             self._dim_input = self.samples.shape[-1]
             self._dim_output = self.samples.shape[-2]
-            samples_T = np.empty(self.samples.shape[:-2], dtype=self.samples.dtype)
             rng = new_rng(0)
             if any(np.iscomplex(sampling_values[0])):
                 w = 1j * rng.normal(scale=np.sqrt(2)/2, size=(self._dim_output,)) \
@@ -128,7 +122,8 @@ class PAAAReductor(BasicObject):
                 v = rng.normal(size=(self._dim_input,))
             w /= np.linalg.norm(w)
             v /= np.linalg.norm(v)
-            samples_T = self.samples @ v @ w
+            # project from both sides in a single pass over the samples
+            samples_T = np.einsum('...ij,j,i->...', self.samples, v, w)
             self.MIMO_samples = self.samples
             self.samples = samples_T
         else:
@@ -179,7 +174,25 @@ class PAAAReductor(BasicObject):
         assert len(max_itpl) == len(svs)
 
         # start iteration with constant function
-        bary_func = np.vectorize(lambda *args: np.mean(samples))
+        def bary_func(*args):
+            return np.mean(samples)
+
+        # sampling values reshaped such that they broadcast to the shape of samples
+        grid = [sv.reshape((1,)*i + (-1,) + (1,)*(self.num_vars-i-1)) for i, sv in enumerate(svs)]
+
+        # entries of the full Loewner matrix, interpolation samples and nodes for loewner_part
+        loewner_entries = None
+        loewner_part = None
+
+        err_mat = np.empty(samples.shape, dtype=samples.real.dtype)
+        diff_mat = np.empty(samples.shape, dtype=np.result_type(samples, complex))
+
+        # index of the first occurrence of each Laplace variable value
+        # for finding conjugate partners
+        sv0_idx = {}
+        if self.conjugate:
+            for i, s in enumerate(svs[0]):
+                sv0_idx.setdefault(complex(s), i)
 
         # iteration counter
         j = 0
@@ -187,18 +200,16 @@ class PAAAReductor(BasicObject):
         while any(len(i) < mi for i, mi in zip(self.itpl_part, max_itpl)):
 
             # compute approximation error over entire sampled data set
-            grid = np.meshgrid(*svs, indexing='ij')
-            err_mat = np.abs(bary_func(*grid) - samples)
+            np.subtract(bary_func(*grid), samples, out=diff_mat)
+            np.abs(diff_mat, out=err_mat)
 
-            # set errors to zero such that new interpolation points are consistent with max_itpl
-            zero_idx = []
-            for i in range(self.num_vars):
-                if len(self.itpl_part[i]) >= max_itpl[i]:
-                    zero_idx.append(list(range(samples.shape[i])))
-                else:
-                    zero_idx.append(self.itpl_part[i])
-            err_mat[np.ix_(*zero_idx)] = 0
-            err = np.max(err_mat)
+            # set errors to zero such that new interpolation points are consistent with max_itpl,
+            # variables for which no interpolation points can be added are covered by slices
+            full = [len(ip) >= mi for ip, mi in zip(self.itpl_part, max_itpl)]
+            itpl_idx = iter(np.ix_(*(ip for ip, f in zip(self.itpl_part, full) if not f)))
+            err_mat[tuple(slice(None) if f else next(itpl_idx) for f in full)] = 0
+            max_err_idx = err_mat.argmax()
+            err = err_mat.flat[max_err_idx]
 
             j += 1
             self.logger.info(f'Relative error at step {j}: {err/max_samples:.5e}, '
@@ -208,7 +219,7 @@ class PAAAReductor(BasicObject):
             if err <= rel_tol:
                 break
 
-            greedy_idx = np.unravel_index(err_mat.argmax(), err_mat.shape)
+            greedy_idx = np.unravel_index(max_err_idx, err_mat.shape)
             for i in range(self.num_vars):
                 if greedy_idx[i] not in self.itpl_part[i] and len(self.itpl_part[i]) < max_itpl[i]:
                     self.itpl_part[i].append(greedy_idx[i])
@@ -216,13 +227,27 @@ class PAAAReductor(BasicObject):
                     # perform double interpolation step to allow real state-space representation
                     if i == 0 and self.conjugate and np.imag(svs[i][greedy_idx[i]]) != 0:
                         conj_sample = np.conj(svs[i][greedy_idx[i]])
-                        conj_idx = np.where(svs[0] == conj_sample)[0]
-                        self.itpl_part[i].append(conj_idx[0])
-
-            # solve LS problem
-            L = full_nd_loewner(samples, svs, self.itpl_part)
-
-            _, S, V = spla.svd(L, full_matrices=False, lapack_driver='gesvd')
+                        self.itpl_part[i].append(sv0_idx[complex(conj_sample)])
+
+            # solve LS problem, only computing Loewner matrix entries for new columns
+            if loewner_entries is None or any(ip[:len(lp)] != lp for ip, lp in zip(self.itpl_part, loewner_part)):
+                loewner_entries = _loewner_entries(samples, svs, self.itpl_part)
+                loewner_samples = samples[np.ix_(*self.itpl_part)]
+                loewner_nodes = [sv[ip] for sv, ip in zip(svs, self.itpl_part)]
+                loewner_part = [list(ip) for ip in self.itpl_part]
+            for i in range(self.num_vars):
+                new_idx = self.itpl_part[i][len(loewner_part[i]):]
+                if new_idx:
+                    cols = loewner_part.copy()
+                    cols[i] = new_idx
+                    loewner_entries = np.concatenate((loewner_entries, _loewner_entries(samples, svs, cols)),
+                                                     axis=self.num_vars + i)
+                    loewner_samples = np.concatenate((loewner_samples, samples[np.ix_(*cols)]), axis=i)
+                    loewner_nodes[i] = np.concatenate((loewner_nodes[i], svs[i][new_idx]))
+                    loewner_part[i] = list(self.itpl_part[i])
+            L = _select_loewner_entries(loewner_entries, svs, self.itpl_part)
+
+            S, V = _loewner_svd(L)
             VH = V.T.conj()
             coefs = VH[:, -1]
 
@@ -239,11 +264,11 @@ class PAAAReductor(BasicObject):
                 else:
                     self.logger.warning('Non-minimal order interpolant computed.')
 
-            # update barycentric form
-            itpl_samples = samples[np.ix_(*self.itpl_part)]
+            # update barycentric form, post-processing may have truncated the partition
+            itpl_samples = loewner_samples[tuple(slice(len(ip)) for ip in self.itpl_part)]
             itpl_samples = np.reshape(itpl_samples, -1)
-            itpl_nodes = [sv[lp] for sv, lp in zip(svs, self.itpl_part)]
-            bary_func = np.vectorize(make_bary_func(itpl_nodes, itpl_samples, coefs))
+            itpl_nodes = [ln[:len(ip)] for ln, ip in zip(loewner_nodes, self.itpl_part)]
+            bary_func = make_bary_func(itpl_nodes, itpl_samples, coefs)
 
             if self.post_process and d_nsp >= 1:
                 self.logger.info('Converged due to non-trivial null space of Loewner matrix after post-processing.')
@@ -268,24 +293,20 @@ class PAAAReductor(BasicObject):
         max_idx = np.argmax([len(ip) for ip in self.itpl_part])
         max_rks = []
         for i in range(self.num_vars):
-            max_rk = 0
             # we don't need to compute this max rank since we exploit nullspace structure
             if i == max_idx:
                 max_rks.append(len(self.itpl_part[max_idx])-1)
                 continue
-            shapes = []
-            for j in range(self.num_vars):
-                if i != j:
-                    shapes.append(self.samples.shape[j])
-            # compute max ranks of all possible 1-D Loewner matrices
-            for idc in itertools.product(*(range(s) for s in shapes)):
-                l_idc = list(idc)
-                l_idc.insert(i, slice(None))
-                L = nd_loewner(self.samples[tuple(l_idc)], [self.sampling_values[i]], [self.itpl_part[i]])
-                rk = np.linalg.matrix_rank(L, tol=self.L_rk_tol)
-                if rk > max_rk:
-                    max_rk = rk
-            max_rks.append(max_rk)
+            # the denominators of all 1-D Loewner matrices with respect to
+            # the i-th variable coincide
+            itpl_i = self.itpl_part[i]
+            ls_i = sorted(set(range(len(self.sampling_values[i]))) - set(itpl_i))
+            pd = self.sampling_values[i][ls_i][:, np.newaxis] - self.sampling_values[i][itpl_i]
+            # compute max ranks of all possible 1-D Loewner matrices with a single batched SVD
+            samples_i = np.moveaxis(self.samples, i, -1).reshape(-1, self.samples.shape[i])
+            Ls = (samples_i[:, ls_i, np.newaxis] - samples_i[:, np.newaxis, itpl_i]) / pd
+            S = np.linalg.svd(Ls, compute_uv=False)
+            max_rks.append(int(np.max(np.sum(S > self.L_rk_tol, axis=-1))))
         # exploit nullspace structure to obtain final max rank
         denom = np.prod([len(self.itpl_part[k])-max_rks[k] for k in range(len(self.itpl_part))])
         if denom == 0 or d_nsp % denom != 0:
@@ -297,7 +318,7 @@ class PAAAReductor(BasicObject):
 
         # solve LS problem
         L = full_nd_loewner(self.samples, self.sampling_values, self.itpl_part)
-        _, S, V = spla.svd(L, full_matrices=False, lapack_driver='gesvd')
+        _, V = _loewner_svd(L)
         VH = np.conj(V.T)
         coefs = VH[:, -1:]
 
@@ -328,13 +349,18 @@ def nd_loewner(samples, svs, itpl_part):
     d = len(samples.shape)
     ls_part = [sorted(set(range(len(s))) - set(p)) for p, s in zip(itpl_part, svs)]
 
+    # build the Kronecker product of the differences by broadcasting over separate axes
     sdpd = 1
     for i in range(d):
         p0 = svs[i]
         p = p0[itpl_part[i]]
         ph = p0[ls_part[i]]
         pd = ph[:, np.newaxis] - p
-        sdpd = np.kron(sdpd, pd)
+        shape = [1] * (2 * d)
+        shape[i] = len(ph)
+        shape[d + i] = len(p)
+        sdpd = sdpd * pd.reshape(shape)
+    sdpd = np.reshape(sdpd, (int(np.prod([len(lp) for lp in ls_part])), -1))
     samples0 = samples[np.ix_(*itpl_part)].reshape(-1)
     samples1 = samples[np.ix_(*ls_part)].reshape(-1, 1)
     samplesd = samples1 - samples0
@@ -363,38 +389,101 @@ def full_nd_loewner(samples, svs, itpl_part):
     L
         (Parametric) Loewner matrix based on all combinations of partitions.
     """
-    L = nd_loewner(samples, svs, itpl_part)
-    range_S = range(len(svs))
-
-    # consider all combinations of variables coming from interpolation vs LS partition
-    # `i_itpl[i]` is `True` if we are considering a partitioning where the `i`-th parameter
-    # is interpolated
-    for i_itpl in itertools.product(*([False, True] for _ in range_S)):
-
-        # skip cases corresponding to all interpolated or all LS fit
-        if not any(i_itpl) or all(i_itpl):
-            continue
-
-        svs0 = [svs[k] for k in range_S if i_itpl[k]]
-        itpl_part0 = [itpl_part[k] for k in range_S if i_itpl[k]]
-
-        for j in itertools.product(*(itpl_part[k] for k in range_S if not i_itpl[k])):
-            l_j = list(j)
-            for ii in range(len(i_itpl)):
-                if i_itpl[ii]:
-                    l_j.insert(ii, slice(None))
-            samples0 = samples[tuple(l_j)]
-            T_mat = 1
-            for k in range_S:
-                if i_itpl[k]:
-                    T_new = np.eye(len(itpl_part[k]))
-                else:
-                    idx = np.where(np.array(itpl_part[k]) == l_j[k])[0][0]
-                    T_new = np.eye(1, len(itpl_part[k]), idx)
-                T_mat = np.kron(T_mat, T_new)
-            LL = nd_loewner(samples0, svs0, itpl_part0)
-            L = np.vstack([L, LL @ T_mat])
-    return L
+    entries = _loewner_entries(samples, svs, itpl_part)
+    return _select_loewner_entries(entries, svs, itpl_part)
+
+
+def _loewner_entries(samples, svs, cols):
+    """Compute entries of the full Loewner matrix for all samples and the given columns.
+
+    The returned tensor `E` has the shape `samples.shape + (len(cols[0]), ..., len(cols[-1]))`.
+    For a multi-index `r` of a sample and a multi-index `c` of a column, `E[r + c]` is the
+    divided difference of `samples[r]` and `samples[c]` with respect to all variables for
+    which `r` and `c` differ. These entries do not depend on the interpolation partition,
+    such that they can be reused when new interpolation indices are added. The actual
+    Loewner matrix is obtained with :func:`_select_loewner_entries`.
+    """
+    d = len(svs)
+    col_shape = tuple(len(c) for c in cols)
+    samplesd = (samples.reshape(samples.shape + (1,) * d)
+                - samples[np.ix_(*cols)].reshape((1,) * d + col_shape))
+    sdpd = 1
+    for k in range(d):
+        pd = svs[k][:, np.newaxis] - svs[k][cols[k]]
+        pd[np.arange(len(svs[k]))[:, np.newaxis] == np.asarray(cols[k], dtype=int)] = 1
+        shape = [1] * (2 * d)
+        shape[k] = len(svs[k])
+        shape[d + k] = len(cols[k])
+        sdpd = sdpd * pd.reshape(shape)
+    return samplesd / sdpd
+
+
+def _select_loewner_entries(entries, svs, itpl_part):
+    """Assemble the full Loewner matrix from the output of :func:`_loewner_entries`.
+
+    The columns of `entries` have to correspond to `itpl_part`.
+    """
+    d = len(svs)
+    keep = True
+    for k in range(d):
+        is_itpl = np.zeros(len(svs[k]), dtype=bool)
+        is_itpl[itpl_part[k]] = True
+        # rows fixed to an interpolation index only couple to columns with the same index
+        mismatch = is_itpl[:, np.newaxis] & (np.arange(len(svs[k]))[:, np.newaxis]
+                                              != np.asarray(itpl_part[k], dtype=int))
+        shape = [1] * (2 * d)
+        shape[k] = len(svs[k])
+        shape[d + k] = len(itpl_part[k])
+        keep = keep & ~mismatch.reshape(shape)
+    L = np.where(keep, entries, 0)
+    L = L.reshape(int(np.prod(entries.shape[:d])), -1)
+    rows = _full_loewner_rows(svs, itpl_part)
+    # gather the rows into a Fortran-ordered array as required by LAPACK, such that no
+    # further copy is made in _loewner_svd; the transposed output is C-contiguous which
+    # allows np.take to write into it directly
+    out = np.empty((len(rows), L.shape[1]), dtype=L.dtype, order='F')
+    np.take(L.T, rows, axis=1, out=out.T, mode='clip')
+    return out
+
+
+def _full_loewner_rows(svs, itpl_part):
+    """Return flat sample indices of the rows of :func:`full_nd_loewner` in their order.
+
+    The first block of rows belongs to the LS partitions of all variables. Then, for
+    each combination of variables which are interpolated, the rows are ordered by the
+    interpolation indices of these variables first and the LS indices of the remaining
+    variables second.
+    """
+    d = len(svs)
+    shape = [len(sv) for sv in svs]
+    ls_part = [sorted(set(range(len(s))) - set(p)) for p, s in zip(itpl_part, svs)]
+    # `i_ls[k]` is `True` if the rows of the block belong to the LS partition of the `k`-th variable
+    combinations = [(True,) * d] + [i_ls for i_ls in itertools.product((False, True), repeat=d)
+                                    if any(i_ls) and not all(i_ls)]
+    rows = []
+    for i_ls in combinations:
+        idx = np.ravel_multi_index(np.ix_(*(ls_part[k] if i_ls[k] else itpl_part[k] for k in range(d))), shape)
+        axes = [k for k in range(d) if not i_ls[k]] + [k for k in range(d) if i_ls[k]]
+        rows.append(idx.transpose(axes).ravel())
+    return np.concatenate(rows)
+
+
+def _loewner_svd(L):
+    """Compute singular values and right singular vectors of a Loewner matrix.
+
+    The divide-and-conquer driver `gesdd` is used first. If it does not converge, the
+    computation is repeated with `gesvd`. For matrices with many more rows than columns,
+    the SVD is computed from the triangular factor of a QR decomposition such that no
+    left singular vectors need to be formed. The contents of `L` may be overwritten.
+    """
+    m, n = L.shape
+    if m > 2 * n:
+        L = spla.qr(L, overwrite_a=True, mode='r', check_finite=False)[0][:n]
+    try:
+        _, S, V = spla.svd(L, full_matrices=False, check_finite=False, lapack_driver='gesdd')
+    except spla.LinAlgError:
+        _, S, V = spla.svd(L, full_matrices=False, check_finite=False, lapack_driver='gesvd')
+    return S, V
 
 
 def make_bary_func(itpl_nodes, itpl_vals, coefs, removable_singularity_tol=1e-14):
@@ -429,24 +518,38 @@ def make_bary_func(itpl_nodes, itpl_vals, coefs, removable_singularity_tol=1e-14
     Returns
     -------
     bary_func
-        (Multi-variate) rational function in barycentric form.
+        (Multi-variate) rational function in barycentric form. The function can be evaluated
+        on |NumPy arrays| of broadcastable shapes, one for each variable. For scalar arguments
+        the value is returned as a 2-dimensional |NumPy array|, otherwise the result has the
+        broadcasted shape of the arguments (followed by `dim_output` and `dim_input` in the
+        MIMO case).
     """
+    itpl_vals = np.asarray(itpl_vals)
+    coefs = np.ravel(coefs)
+    # the numerator only depends on the products of coefficients and interpolation values
+    coefs_vals = coefs[:, np.newaxis] * itpl_vals.reshape(len(coefs), -1)
+
     def bary_func(*args):
-        pd = 1
-        # this loop is for pole cancellation which occurs at interpolation nodes
+        pd = None
         for arg, itpl_node in zip(args, itpl_nodes):
-            d = arg - itpl_node
-            d_zero = d[np.abs(d) < removable_singularity_tol]
-            if len(d_zero) > 0:
-                d_min_idx = np.argmin(np.abs(d))
-                d = np.eye(1, len(d), d_min_idx)
+            d = np.asarray(arg)[..., np.newaxis] - itpl_node
+            abs_d = np.abs(d)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cd = 1 / d
+            # pole cancellation which occurs at interpolation nodes
+            near_node = np.any(abs_d < removable_singularity_tol, axis=-1)
+            if np.any(near_node):
+                cd[near_node] = np.eye(d.shape[-1])[np.argmin(abs_d[near_node], axis=-1)]
+            if pd is None:
+                pd = cd
             else:
-                d = 1 / d
-            pd = np.kron(pd, d)
-        coefs_pd = coefs * pd
-        num = np.inner(coefs_pd, itpl_vals)
-        denom = np.sum(coefs_pd)
-        nd = num / denom
-        return np.atleast_2d(nd)
+                pd = pd[..., :, np.newaxis] * cd[..., np.newaxis, :]
+                pd = pd.reshape(pd.shape[:-2] + (-1,))
+        denom = pd @ coefs
+        nd = (pd @ coefs_vals) / np.expand_dims(denom, -1)
+        nd = nd.reshape(nd.shape[:-1] + itpl_vals.shape[1:])
+        if nd.ndim == 0:
+            nd = nd.reshape(1, 1)
+        return nd
 
     return bary_func
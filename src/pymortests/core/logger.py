@@ -7,7 +7,7 @@ import logging
 import pytest
 
 import pymor.core as core
-from pymor.core.logger import log_levels
+from pymor.core.logger import BLOCK_TIME, ColoredFormatter, log_levels
 from pymor.operators.numpy import NumpyMatrixOperator
 from pymortests.base import runmodule
 
@@ -39,6 +39,11 @@ def test_log_levels():
     assert before_name == logging.getLevelName(logger.level)
 
 
+def test_block_time_message_args():
+    record = logging.LogRecord('pymor.test', BLOCK_TIME, __file__, 0, 'duration: %ss', (0.5,), None)
+    assert ColoredFormatter().format(record).endswith('duration: 0.5s')
+
+
 @pytest.mark.parametrize('verb', ('info', 'error', 'fatal', 'debug', 'block', 'info2', 'info3', 'warning'))
 def test_once(verb, capsys):
     logger = NumpyMatrixOperator._logger
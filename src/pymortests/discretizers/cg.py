@@ -0,0 +1,142 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+import gc
+import itertools
+import weakref
+
+import numpy as np
+import pytest
+from scipy.sparse import coo_matrix, csc_matrix
+
+from pymor.analyticalproblems.functions import ConstantFunction
+from pymor.discretizers.builtin.cg import (
+    BoundaryL2ProductFunctional,
+    L2ProductFunctionalP1,
+    L2ProductFunctionalQ1,
+    _assemble_element_matrices,
+    _cached_per_grid,
+    _element_sparsity_pattern,
+    _tabulate_shape_function_gradients,
+    _tabulate_shape_functions,
+)
+from pymor.discretizers.builtin.grids.boundaryinfos import AllDirichletBoundaryInfo
+from pymor.discretizers.builtin.grids.rect import RectGrid
+from pymor.discretizers.builtin.grids.referenceelements import square, triangle
+from pymor.discretizers.builtin.grids.tria import TriaGrid
+from pymor.tools.random import get_rng
+from pymortests.base import runmodule
+
+pytestmark = pytest.mark.builtin
+
+
+def _assemble_element_matrices_reference(grid, SF_INTS, clear_rows, clear_columns, unit_diagonal):
+    n = grid.size(grid.dim)
+    subentities = grid.subentities(0, grid.dim)
+    k = subentities.shape[1]
+    I0 = np.repeat(subentities, k, axis=1).ravel()
+    I1 = np.tile(subentities, (1, k)).ravel()
+    A = coo_matrix((SF_INTS, (I0, I1)), shape=(n, n)).toarray()
+    if clear_rows is not None:
+        A[clear_rows, :] = 0
+    if clear_columns is not None:
+        A[:, clear_columns] = 0
+    if unit_diagonal is not None:
+        idx = np.flatnonzero(unit_diagonal)
+        A[idx, idx] += 1
+    return A
+
+
+@pytest.mark.parametrize('grid_type', [TriaGrid, RectGrid])
+@pytest.mark.parametrize('complex_data', [False, True])
+def test_assemble_element_matrices(grid_type, complex_data):
+    grid = grid_type(num_intervals=(3, 4))
+    k = grid.subentities(0, grid.dim).shape[1]
+    rng = get_rng()
+    SF_INTS = rng.normal(size=grid.size(0) * k * k)
+    if complex_data:
+        SF_INTS = SF_INTS + 1j * rng.normal(size=len(SF_INTS))
+    DM = AllDirichletBoundaryInfo(grid).dirichlet_mask(grid.dim)
+    for clear_rows, clear_columns, unit_diagonal in itertools.product((None, DM), repeat=3):
+        A = _assemble_element_matrices(grid, SF_INTS, clear_rows=clear_rows, clear_columns=clear_columns,
+                                       unit_diagonal=unit_diagonal)
+        A_ref = _assemble_element_matrices_reference(grid, SF_INTS, clear_rows, clear_columns, unit_diagonal)
+        assert isinstance(A, csc_matrix)
+        assert A.has_sorted_indices
+        assert np.all(A.data != 0)
+        assert np.allclose(A.toarray(), A_ref)
+
+
+@pytest.mark.parametrize('grid_type,functional_type', [
+    (TriaGrid, L2ProductFunctionalP1),
+    (RectGrid, L2ProductFunctionalQ1),
+    (TriaGrid, BoundaryL2ProductFunctional),
+    (RectGrid, BoundaryL2ProductFunctional),
+])
+def test_complex_functionals(grid_type, functional_type):
+    grid = grid_type(num_intervals=(3, 4))
+    boundary_info = AllDirichletBoundaryInfo(grid)
+    for dirichlet_clear_dofs in (False, True):
+        def assemble(value):
+            return functional_type(grid, ConstantFunction(value, 2), dirichlet_clear_dofs=dirichlet_clear_dofs,
+                                   boundary_info=boundary_info).assemble().matrix
+        F = assemble(1 + 2j)
+        assert np.iscomplexobj(F)
+        assert np.allclose(F, assemble(1.) + 2j * assemble(1.))
+
+
+@pytest.mark.parametrize('reference_element,tabulate', [
+    (triangle, _tabulate_shape_functions),
+    (square, _tabulate_shape_functions),
+    (square, _tabulate_shape_function_gradients),
+])
+def test_tabulate_shape_functions(reference_element, tabulate):
+    _, w = reference_element.quadrature(order=2)
+    writeable = w.flags.writeable
+    SF, w_tab = tabulate(reference_element, 2)
+    assert tabulate(reference_element, 2)[0] is SF
+    assert not SF.flags.writeable and not w_tab.flags.writeable
+    assert np.all(w_tab == w)
+    # the arrays of the reference element are left untouched
+    assert reference_element.quadrature(order=2)[1].flags.writeable == writeable
+
+
+def test_element_sparsity_pattern_cache():
+    grid = TriaGrid(num_intervals=(2, 2))
+    pattern = _element_sparsity_pattern(grid)
+    assert _element_sparsity_pattern(grid) is pattern
+    assert not any(a.flags.writeable for a in pattern)
+    # a different grid with the same structure gets its own pattern
+    assert _element_sparsity_pattern(TriaGrid(num_intervals=(2, 2))) is not pattern
+
+
+def test_cached_per_grid():
+    num_calls = 0
+
+    @_cached_per_grid
+    def func(grid):
+        nonlocal num_calls
+        num_calls += 1
+        return np.arange(grid.size(0))
+
+    grid, other_grid = TriaGrid(num_intervals=(2, 2)), TriaGrid(num_intervals=(2, 2))
+    value = func(grid)
+    assert func(grid) is value
+    assert num_calls == 1
+    other_value = func(other_grid)
+    assert other_value is not value
+    assert num_calls == 2
+
+    # the cached values are released together with their grid
+    grid_ref, value_ref = weakref.ref(grid), weakref.ref(value)
+    del grid, value
+    gc.collect()
+    assert grid_ref() is None
+    assert value_ref() is None
+    assert func(other_grid) is other_value
+    assert num_calls == 2
+
+
+if __name__ == '__main__':
+    runmodule(filename=__file__)
@@ -0,0 +1,134 @@
+# This file is part of the pyMOR project (https://www.pymor.org).
+# Copyright pyMOR developers and contributors. All rights reserved.
+# License: BSD 2-Clause License (https://opensource.org/licenses/BSD-2-Clause)
+
+import itertools
+
+import numpy as np
+import pytest
+
+from pymor.models.transfer_function import TransferFunction
+from pymor.reductors.aaa import PAAAReductor, full_nd_loewner, make_bary_func
+from pymor.tools.random import get_rng
+
+pytestmark = pytest.mark.builtin
+
+
+def _full_nd_loewner_reference(samples, svs, itpl_part):
+    d = len(svs)
+    ls_part = [[i for i in range(len(sv)) if i not in ip] for sv, ip in zip(svs, itpl_part)]
+    cols = list(itertools.product(*itpl_part))
+    # the first block of rows belongs to the LS partitions of all variables, then for each
+    # combination of variables the rows are fixed to the interpolation indices of the
+    # variables with `i_ls[k] == False`
+    combinations = [(True,) * d] + [i_ls for i_ls in itertools.product((False, True), repeat=d)
+                                    if any(i_ls) and not all(i_ls)]
+    L = []
+    for i_ls in combinations:
+        fixed = [k for k in range(d) if not i_ls[k]]
+        free = [k for k in range(d) if i_ls[k]]
+        for j in itertools.product(*(itpl_part[k] for k in fixed)):
+            for l in itertools.product(*(ls_part[k] for k in free)):
+                r = [0] * d
+                for k, jk in zip(fixed, j):
+                    r[k] = jk
+                for k, lk in zip(free, l):
+                    r[k] = lk
+                row = []
+                for c in cols:
+                    if any(r[k] != c[k] for k in fixed):
+                        row.append(0)
+                    else:
+                        denom = np.prod([svs[k][r[k]] - svs[k][c[k]] for k in free])
+                        row.append((samples[tuple(r)] - samples[c]) / denom)
+                L.append(row)
+    return np.array(L)
+
+
+@pytest.mark.parametrize('shape,itpl_part', [
+    ((6,), [[4, 1]]),
+    ((5, 4), [[3, 1], [0, 2]]),
+    ((4, 3, 3), [[0, 2], [1], [2, 0]]),
+])
+def test_full_nd_loewner(shape, itpl_part):
+    rng = get_rng()
+    svs = [rng.normal(size=n) + 1j * rng.normal(size=n) for n in shape]
+    samples = rng.normal(size=shape) + 1j * rng.normal(size=shape)
+    L = full_nd_loewner(samples, svs, itpl_part)
+    L_ref = _full_nd_loewner_reference(samples, svs, itpl_part)
+    assert L.shape == L_ref.shape
+    assert np.allclose(L, L_ref)
+
+
+@pytest.mark.parametrize('val_shape', [(), (2, 3)])
+def test_make_bary_func(val_shape):
+    rng = get_rng()
+    itpl_nodes = [rng.normal(size=3) + 1j * rng.normal(size=3), rng.normal(size=2)]
+    itpl_vals = rng.normal(size=(6,) + val_shape)
+    # coefficients are passed as a column vector by the post-processing of PAAAReductor
+    coefs = rng.normal(size=(6, 1))
+    bary_func = make_bary_func(itpl_nodes, itpl_vals, coefs)
+
+    def reference(s, p):
+        num, denom = 0, 0
+        for (i, si), (j, pj) in itertools.product(enumerate(itpl_nodes[0]), enumerate(itpl_nodes[1])):
+            c = coefs[2 * i + j, 0] / ((s - si) * (p - pj))
+            num = num + c * itpl_vals[2 * i + j]
+            denom = denom + c
+        return num / denom
+
+    assert bary_func(0.5j, 0.3).shape == (val_shape or (1, 1))
+    assert np.allclose(bary_func(0.5j, 0.3), reference(0.5j, 0.3))
+    # interpolation at the nodes
+    for (i, si), (j, pj) in itertools.product(enumerate(itpl_nodes[0]), enumerate(itpl_nodes[1])):
+        assert np.allclose(bary_func(si, pj), itpl_vals[2 * i + j])
+    # evaluation on broadcastable arrays
+    s = np.array([0.5j, 1j, 2j])[:, np.newaxis]
+    p = np.array([0.3, 0.7])
+    H = bary_func(s, p)
+    assert H.shape == (3, 2) + val_shape
+    for k, l in itertools.product(range(3), range(2)):
+        assert np.allclose(H[k, l], reference(s[k, 0], p[l]))
+
+
+def test_paaa_siso():
+    s = 1j * np.logspace(-1, 1, 20)
+    samples = 1 / (s + 1) + 2 / (s + 3)
+    reductor = PAAAReductor(s, samples)
+    rom = reductor.reduce()
+    assert isinstance(rom, TransferFunction)
+    assert rom.dim_input == rom.dim_output == 1
+    for i in reductor.itpl_part[0]:
+        sv = reductor.sampling_values[0][i]
+        assert np.allclose(rom.eval_tf(sv), 1 / (sv + 1) + 2 / (sv + 3))
+
+
+def test_paaa_parametric_siso():
+    s = 1j * np.logspace(-1, 1, 10)
+    p = np.linspace(1, 2, 5)
+    samples = 1 / (s[:, np.newaxis] + p)
+    reductor = PAAAReductor([s, p], samples)
+    rom = reductor.reduce()
+    assert rom.parametric
+    for i, j in itertools.product(*reductor.itpl_part):
+        sv, pv = reductor.sampling_values[0][i], reductor.sampling_values[1][j]
+        assert np.allclose(rom.eval_tf(sv, mu=pv), 1 / (sv + pv))
+
+
+def test_paaa_mimo():
+    rng = get_rng()
+    A = np.diag([-1., -2., -3.])
+    B = rng.normal(size=(3, 2))
+    C = rng.normal(size=(2, 3))
+
+    def H(s):
+        return C @ np.linalg.solve(s * np.eye(3) - A, B)
+
+    s = 1j * np.logspace(-1, 1, 20)
+    samples = np.array([H(sv) for sv in s])
+    reductor = PAAAReductor(s, samples)
+    rom = reductor.reduce()
+    assert rom.dim_input == 2 and rom.dim_output == 2
+    for i in reductor.itpl_part[0]:
+        sv = reductor.sampling_values[0][i]
+        assert np.allclose(rom.eval_tf(sv), H(sv))
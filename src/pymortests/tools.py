@@ -102,6 +102,91 @@ def test_quadrature_points():
         assert P[-1] < 1.0
 
 
+def test_quadrature_symmetry():
+    for order in GaussQuadratures.orders:
+        P, W = GaussQuadratures.quadrature(order)
+        assert float_cmp_all(P, 1 - P[::-1])
+        assert float_cmp_all(W, W[::-1])
+
+
+def test_quadrature_invalid_arguments():
+    for kwargs in ({}, {'order': 1, 'npoints': 1}, {'order': -1}, {'order': 1.5}, {'npoints': 0},
+                   {'order': float('inf')}, {'order': '1'}, {'npoints': '1'}, {'npoints': [1]},
+                   {'order': len(GaussQuadratures.order_map)},
+                   {'npoints': GaussQuadratures.maxpoints() + 1}):
+        with pytest.raises(ValueError):
+            GaussQuadratures.quadrature(**kwargs)
+    for kwargs in ({'order': -1}, {'order': 1.5}, {'order': float('inf')}, {'order': float('nan')},
+                   {'order': '1'}, {'order': [1]}, {'npoints': 0}, {'npoints': float('inf')},
+                   {'npoints': '1'}, {'npoints': [1]}):
+        with pytest.raises(ValueError):
+            GaussQuadratures.computed_quadrature(**kwargs)
+
+
+def test_quadrature_golub_welsch():
+    from pymor.discretizers.builtin.quadratures import _golub_welsch
+    for npoints in range(2, GaussQuadratures.maxpoints() + 1):
+        P, W = GaussQuadratures.quadrature(npoints=npoints)
+        P_gw, W_gw = _golub_welsch(npoints)
+        assert float_cmp_all(P_gw, P)
+        assert float_cmp_all(W_gw, W)
+    npoints = 2 * GaussQuadratures.maxpoints()
+    with pytest.raises(ValueError):
+        GaussQuadratures.quadrature(npoints=npoints)
+    P, W = GaussQuadratures.computed_quadrature(npoints=npoints)
+    for n, function, _, integral in polynomials(2 * npoints - 1):
+        assert float_cmp(W @ function(P), integral, rtol=1e-12)
+
+
+def test_quadrature_packed():
+    for order in GaussQuadratures.orders:
+        P, W = GaussQuadratures.quadrature(order)
+        PW = GaussQuadratures.quadrature_packed(order)
+        assert np.all(PW['point'] == P)
+        assert np.all(PW['weight'] == W)
+
+
+def test_quadrature_memoryviews():
+    for order in GaussQuadratures.orders:
+        P, W = GaussQuadratures.quadrature(order)
+        P_mv, W_mv = GaussQuadratures.quadrature_memoryviews(order)
+        assert P_mv.readonly and W_mv.readonly
+        assert np.all(np.asarray(P_mv) == P)
+        assert np.all(np.asarray(W_mv) == W)
+
+
+def test_quadrature_on():
+    for order in GaussQuadratures.orders:
+        P, W = GaussQuadratures.quadrature(order)
+        P_ab, W_ab = GaussQuadratures.quadrature_on(-1, 3, order)
+        assert float_cmp_all(P_ab, -1 + 4 * P)
+        assert float_cmp_all(W_ab, 4 * W)
+
+
+def test_quadrature_integrate():
+    for n, function, _, integral in polynomials(GaussQuadratures.orders[-1]):
+        for order in GaussQuadratures.orders:
+            if n > order / 2:
+                continue
+            ret = GaussQuadratures.integrate(function, -1, 1, order)
+            assert float_cmp(ret, (1 - (-1)**(n+1)) * integral)
+
+
+def test_quadrature_batch():
+    a = np.linspace(0, 1, 5)[:-1]
+    b = np.linspace(0, 1, 5)[1:]
+    for order in GaussQuadratures.orders:
+        P, W = GaussQuadratures.quadrature_batch(a, b, order)
+        for i in range(len(a)):
+            P_i, W_i = GaussQuadratures.quadrature_on(a[i], b[i], order)
+            assert float_cmp_all(P[i], P_i)
+            assert float_cmp_all(W[i], W_i)
+        assert float_cmp_all(np.einsum('ij,ij->i', W, np.exp(P)),
+                             np.array([GaussQuadratures.integrate(np.exp, a[i], b[i], order)
+                                       for i in range(len(a))]))
+    assert float_cmp(np.einsum('ij,ij->i', W, np.exp(P)).sum(), exp(1) - exp(0))
+
+
 def test_float_cmp():
     tol_range = [0.0, 1e-8, 1]
     nan = float('nan')